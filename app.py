@@ -1,6 +1,7 @@
+import pandas as pd
 import streamlit as st
 from auth.auth import authenticate
-from job_tracker.sheets import load_data_sheet
+from job_tracker.sheets import load_data_sheet, refresh_data_sheet
 from job_tracker.pages import (
     add_application_page,
     search_by_company_page,
@@ -9,6 +10,11 @@ from job_tracker.pages import (
     settings_page
 )
 
+# Sessions share cached DataFrames (job_tracker/cache.py); copy-on-write keeps one
+# session's edits out of every other session's view. Always on from pandas 3.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
 def main():
     st.title("📊 Job Application Tracker (Desktop App OOB Flow)")
     
@@ -19,6 +25,8 @@ def main():
 
 
     # Load data and setup navigation
+    if st.sidebar.button("🔄 Refresh data"):
+        refresh_data_sheet()
     df = load_data_sheet()
     
     page_selection = st.sidebar.radio(
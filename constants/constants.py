@@ -17,3 +17,11 @@ APPLICATION_STATUS_OPTIONS = [
     "Positive Response received (further rounds)",
     "Rejected",
 ]
+
+SHEET_NAME = "job-tracker"
+
+# Process-wide sheet cache limits; override with JOB_TRACKER_CACHE_MAX_BYTES,
+# JOB_TRACKER_CACHE_MAX_ENTRIES and JOB_TRACKER_CACHE_TTL_SECONDS.
+SHEET_CACHE_MAX_BYTES = 64 * 1024 * 1024
+SHEET_CACHE_MAX_ENTRIES = 32
+SHEET_CACHE_TTL_SECONDS = 60
@@ -0,0 +1,130 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+from constants.constants import SHEET_CACHE_MAX_BYTES, SHEET_CACHE_MAX_ENTRIES, SHEET_CACHE_TTL_SECONDS
+
+
+def _copy_on_write_enabled():
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    return pd.get_option("mode.copy_on_write")
+
+
+def _private_view(frame):
+    """Return a copy of ``frame`` that can be edited without touching the original.
+
+    Under copy-on-write a shallow copy is enough and shares memory until it is
+    written to; otherwise fall back to a deep copy.
+    """
+    return frame.copy(deep=not _copy_on_write_enabled())
+
+
+class _PendingLoad:
+    """A fetch in progress that other callers for the same key can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.frame = None
+        self.error = None
+        self.stale = False
+
+
+class SheetCache:
+    """Process-wide LRU cache of sheet DataFrames, bounded by entry count, memory and age."""
+
+    def __init__(self, max_bytes, max_entries, ttl_seconds, clock=time.monotonic):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries = OrderedDict()  # key -> (frame, nbytes, stored_at)
+        self._pending = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key, loader):
+        """Return a private view of the cached frame for ``key``, loading it once if missing or expired.
+
+        Concurrent callers asking for the same key while a load is in flight
+        wait for that load instead of issuing their own.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._clock() - entry[2] >= self.ttl_seconds:
+                self._discard(key)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return _private_view(entry[0])
+            pending = self._pending.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._pending[key] = _PendingLoad()
+
+        if not owner:
+            pending.done.wait()
+            if isinstance(pending.error, Exception):
+                raise pending.error
+            if pending.frame is None:
+                raise RuntimeError(f"Loading {key!r} was interrupted before it completed.") from pending.error
+            return _private_view(pending.frame)
+
+        try:
+            pending.frame = loader()
+        except BaseException as error:
+            pending.error = error
+            raise
+        finally:
+            try:
+                with self._lock:
+                    if self._pending.get(key) is pending:
+                        del self._pending[key]
+                    # Skip storing if a save or invalidation landed while we were fetching.
+                    if pending.frame is not None and not pending.stale:
+                        self._store(key, pending.frame)
+            finally:
+                pending.done.set()
+        return _private_view(pending.frame)
+
+    def put(self, key, frame):
+        """Replace the cached frame for ``key`` with a snapshot of ``frame``."""
+        with self._lock:
+            self._mark_pending_stale(key)
+            self._store(key, _private_view(frame))
+
+    def invalidate(self, key):
+        """Drop the cached frame for ``key``, if any, so the next load refetches it."""
+        with self._lock:
+            self._mark_pending_stale(key)
+            self._discard(key)
+
+    def _mark_pending_stale(self, key):
+        pending = self._pending.get(key)
+        if pending is not None:
+            pending.stale = True
+
+    def _store(self, key, frame):
+        self._discard(key)
+        nbytes = int(frame.memory_usage(index=True, deep=True).sum())
+        if nbytes > self.max_bytes:
+            return
+        self._entries[key] = (frame, nbytes, self._clock())
+        self._total_bytes += nbytes
+        while self._total_bytes > self.max_bytes or len(self._entries) > self.max_entries:
+            _, (_, evicted_bytes, _) = self._entries.popitem(last=False)
+            self._total_bytes -= evicted_bytes
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry[1]
+
+
+sheet_cache = SheetCache(
+    max_bytes=int(os.environ.get("JOB_TRACKER_CACHE_MAX_BYTES", SHEET_CACHE_MAX_BYTES)),
+    max_entries=int(os.environ.get("JOB_TRACKER_CACHE_MAX_ENTRIES", SHEET_CACHE_MAX_ENTRIES)),
+    ttl_seconds=float(os.environ.get("JOB_TRACKER_CACHE_TTL_SECONDS", SHEET_CACHE_TTL_SECONDS)),
+)
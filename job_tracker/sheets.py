@@ -2,20 +2,40 @@ import pandas as pd
 import gspread
 from google.oauth2.credentials import Credentials
 import streamlit as st
-from constants.constants import SCOPES
+from constants.constants import SCOPES, SHEET_NAME
+from job_tracker.cache import sheet_cache
 
 def get_google_sheet():
     """Authorize with stored credentials and return the first worksheet of 'job-tracker'."""
     creds = Credentials.from_authorized_user_info(info=st.session_state.credentials, scopes=SCOPES)
     gc = gspread.authorize(creds)
     try:
-        sh = gc.open("job-tracker")
+        sh = gc.open(SHEET_NAME)
     except gspread.SpreadsheetNotFound:
-        sh = gc.create("job-tracker")
+        sh = gc.create(SHEET_NAME)
     return sh.sheet1
 
+def _current_cache_key():
+    """Return the cache key for this session's spreadsheet.
+
+    The key is the spreadsheet id, resolved once per session with the session's
+    own credentials, so every login of the same account shares one entry and a
+    session can only reach entries for sheets it was able to open.
+    """
+    if st.session_state.get("spreadsheet_id") is None:
+        st.session_state.spreadsheet_id = get_google_sheet().spreadsheet_id
+    return st.session_state.spreadsheet_id
+
+def refresh_data_sheet():
+    """Drop the cached copy of this session's sheet so the next load refetches it."""
+    sheet_cache.invalidate(_current_cache_key())
+
 def load_data_sheet():
-    """Load data from the Google Sheet into a pandas DataFrame."""
+    """Load the Google Sheet as a DataFrame, shared across sessions through the process-wide cache."""
+    return sheet_cache.get_or_load(_current_cache_key(), _fetch_data_sheet)
+
+def _fetch_data_sheet():
+    """Fetch data from the Google Sheet into a pandas DataFrame, bypassing the cache."""
     sheet = get_google_sheet()
     data = sheet.get_all_values()
     columns = ["company", "job_links", "date_applied", "connection_status", "application_status"]
@@ -32,10 +52,17 @@ def load_data_sheet():
 
 def save_data_sheet(df):
     """Save the pandas DataFrame to the Google Sheet."""
-    sheet = get_google_sheet()
-    sheet.clear()
-    header = list(df.columns)
-    sheet.append_row(header)
-    for i in range(len(df)):
-        row = df.iloc[i].tolist()
-        sheet.append_row(row)
+    key = _current_cache_key()
+    try:
+        sheet = get_google_sheet()
+        sheet.clear()
+        header = list(df.columns)
+        sheet.append_row(header)
+        for i in range(len(df)):
+            row = df.iloc[i].tolist()
+            sheet.append_row(row)
+    except Exception:
+        # The sheet may be partially written; force the next load to refetch it.
+        sheet_cache.invalidate(key)
+        raise
+    sheet_cache.put(key, df)
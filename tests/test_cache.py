@@ -0,0 +1,230 @@
+import threading
+
+import pandas as pd
+import pytest
+
+from job_tracker import cache
+from job_tracker.cache import SheetCache
+
+COLUMNS = ["company", "job_links", "date_applied", "connection_status", "application_status"]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_frame(company="Acme", rows=1):
+    return pd.DataFrame(
+        [[company, "N/A", "2025-01-01", "Connection sent", "Applied"]] * rows,
+        columns=COLUMNS,
+    )
+
+
+def frame_bytes(frame):
+    return int(frame.memory_usage(index=True, deep=True).sum())
+
+
+def make_cache(max_bytes=10**9, max_entries=10, ttl_seconds=60, clock=None):
+    return SheetCache(max_bytes, max_entries, ttl_seconds, clock=clock or FakeClock())
+
+
+def test_hit_does_not_call_loader_again():
+    sheet_cache = make_cache()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return make_frame()
+
+    sheet_cache.get_or_load("sheet", loader)
+    sheet_cache.get_or_load("sheet", loader)
+    assert len(calls) == 1
+
+
+def test_concurrent_loads_are_coalesced():
+    sheet_cache = make_cache()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return make_frame()
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(sheet_cache.get_or_load("sheet", loader)))
+        for _ in range(5)
+    ]
+    threads[0].start()
+    started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert len(results) == 5
+    assert all(result.equals(make_frame()) for result in results)
+
+
+def test_loader_error_reaches_waiters_and_is_not_cached():
+    sheet_cache = make_cache()
+    started = threading.Event()
+    release = threading.Event()
+
+    def failing_loader():
+        started.set()
+        release.wait(5)
+        raise ValueError("boom")
+
+    errors = []
+
+    def load():
+        try:
+            sheet_cache.get_or_load("sheet", failing_loader)
+        except ValueError as error:
+            errors.append(error)
+
+    owner = threading.Thread(target=load)
+    owner.start()
+    started.wait(5)
+    waiter = threading.Thread(target=load)
+    waiter.start()
+    release.set()
+    owner.join(5)
+    waiter.join(5)
+
+    assert not waiter.is_alive()
+    assert len(errors) == 2
+    assert sheet_cache.get_or_load("sheet", make_frame).equals(make_frame())
+
+
+def test_base_exception_in_loader_releases_waiters():
+    sheet_cache = make_cache()
+    started = threading.Event()
+    release = threading.Event()
+
+    def interrupted_loader():
+        started.set()
+        release.wait(5)
+        raise KeyboardInterrupt
+
+    def owner_load():
+        with pytest.raises(KeyboardInterrupt):
+            sheet_cache.get_or_load("sheet", interrupted_loader)
+
+    waiter_errors = []
+
+    def waiter_load():
+        try:
+            sheet_cache.get_or_load("sheet", make_frame)
+        except RuntimeError as error:
+            waiter_errors.append(error)
+
+    owner = threading.Thread(target=owner_load)
+    owner.start()
+    started.wait(5)
+    waiter = threading.Thread(target=waiter_load)
+    waiter.start()
+    release.set()
+    owner.join(5)
+    waiter.join(5)
+
+    assert not waiter.is_alive()
+    assert len(waiter_errors) == 1
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    sheet_cache = make_cache(ttl_seconds=30, clock=clock)
+    sheet_cache.get_or_load("sheet", lambda: make_frame("Old"))
+
+    clock.now = 29
+    assert sheet_cache.get_or_load("sheet", lambda: make_frame("New")).loc[0, "company"] == "Old"
+    clock.now = 30
+    assert sheet_cache.get_or_load("sheet", lambda: make_frame("New")).loc[0, "company"] == "New"
+
+
+def test_lru_eviction_by_entry_count():
+    sheet_cache = make_cache(max_entries=2)
+    sheet_cache.get_or_load("a", lambda: make_frame("A"))
+    sheet_cache.get_or_load("b", lambda: make_frame("B"))
+    sheet_cache.get_or_load("a", lambda: make_frame("A2"))  # "a" is now most recently used
+    sheet_cache.get_or_load("c", lambda: make_frame("C"))
+
+    assert sheet_cache.get_or_load("a", lambda: make_frame("A3")).loc[0, "company"] == "A"
+    assert sheet_cache.get_or_load("b", lambda: make_frame("B2")).loc[0, "company"] == "B2"
+
+
+def test_lru_eviction_by_bytes():
+    frame = make_frame()
+    sheet_cache = make_cache(max_bytes=2 * frame_bytes(frame))
+    sheet_cache.get_or_load("a", lambda: make_frame())
+    sheet_cache.get_or_load("b", lambda: make_frame())
+    sheet_cache.get_or_load("c", lambda: make_frame())
+
+    assert sheet_cache.get_or_load("a", lambda: make_frame("Refetched")).loc[0, "company"] == "Refetched"
+
+
+def test_frame_larger_than_ceiling_is_not_cached():
+    sheet_cache = make_cache(max_bytes=frame_bytes(make_frame()) - 1)
+    sheet_cache.get_or_load("sheet", lambda: make_frame("First"))
+    assert sheet_cache.get_or_load("sheet", lambda: make_frame("Second")).loc[0, "company"] == "Second"
+
+
+def test_put_during_fetch_is_not_overwritten():
+    sheet_cache = make_cache()
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_loader():
+        started.set()
+        release.wait(5)
+        return make_frame("Stale")
+
+    loader_thread = threading.Thread(target=lambda: sheet_cache.get_or_load("sheet", slow_loader))
+    loader_thread.start()
+    started.wait(5)
+    sheet_cache.put("sheet", make_frame("Saved"))
+    release.set()
+    loader_thread.join(5)
+
+    assert sheet_cache.get_or_load("sheet", lambda: make_frame("Refetched")).loc[0, "company"] == "Saved"
+
+
+def test_invalidate_forces_refetch():
+    sheet_cache = make_cache()
+    sheet_cache.get_or_load("sheet", lambda: make_frame("Old"))
+    sheet_cache.invalidate("sheet")
+    assert sheet_cache.get_or_load("sheet", lambda: make_frame("New")).loc[0, "company"] == "New"
+
+
+@pytest.mark.parametrize("copy_on_write", [True, False])
+def test_session_edits_do_not_leak_into_cache(monkeypatch, copy_on_write):
+    monkeypatch.setattr(cache, "_copy_on_write_enabled", lambda: copy_on_write)
+    sheet_cache = make_cache()
+
+    view = sheet_cache.get_or_load("sheet", make_frame)
+    view.at[0, "application_status"] = "Rejected"
+
+    assert sheet_cache.get_or_load("sheet", make_frame).loc[0, "application_status"] == "Applied"
+
+
+@pytest.mark.parametrize("copy_on_write", [True, False])
+def test_put_stores_a_snapshot(monkeypatch, copy_on_write):
+    monkeypatch.setattr(cache, "_copy_on_write_enabled", lambda: copy_on_write)
+    sheet_cache = make_cache()
+    saved = make_frame()
+
+    sheet_cache.put("sheet", saved)
+    saved.at[0, "application_status"] = "Rejected"
+
+    assert sheet_cache.get_or_load("sheet", make_frame).loc[0, "application_status"] == "Applied"